@@ -1,10 +1,21 @@
 import os
-import math
+import asyncio
 import argparse
-import ffmpeg
+import functools
+import hashlib
+import numpy as np
 import json
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+from collections import deque
+from dataclasses import dataclass
+
+try:
+    import orjson  # Optional, faster JSON for the probe output and the silence cache
+except ImportError:
+    orjson = None
 
 # Configure logging to both console and file
 log_file = 'audio_processing.log'  # Specify the log file name
@@ -17,189 +28,285 @@ logging.basicConfig(
     ]
 )
 
-# Function to probe the original MKV file and detect audio codec
-def get_audio_codec(mkv_file: str) -> tuple:
-    probe = ffmpeg.probe(mkv_file)
+# Leading ffmpeg arguments shared by every ffmpeg run that writes files
+FFMPEG_ARGS = ['ffmpeg', '-hide_banner', '-nostats', '-loglevel', 'error', '-y']
+
+MIN_SPLIT_DURATION = 10  # Audio segments shorter than this many seconds are not saved as splits
+MAX_COVERS_PER_RUN = 16  # Cover images (each its own ffmpeg input and video decoder) extracted per ffmpeg run
+
+# Matches the "silence_start: <t>" and "silence_end: <t>" lines printed by ffmpeg's silencedetect filter
+SILENCE_RE = re.compile(rb'silence_(start|end): (-?[\d.]+(?:e[-+]?\d+)?)')
+STDERR_TAIL_LINES = 20  # Lines of ffmpeg output kept for error reporting
+
+# Settings for the NumPy RMS silence detector: mono 16 kHz PCM measured in 32 ms frames
+RMS_SAMPLE_RATE = 16000
+RMS_FRAME_SIZE = 512  # Samples per RMS frame
+RMS_FRAMES_PER_READ = 1024  # Frames decoded per read from ffmpeg (~33 seconds of audio)
+
+# Function to parse JSON from bytes, with orjson when it's installed
+def json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# Function to serialize to compact JSON bytes, with orjson when it's installed
+def json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj, separators=(',', ':')).encode()
+
+# Media details of the original MKV file needed for splitting
+@dataclass(frozen=True)
+class MediaInfo:
+    duration: float
+    codec_name: str
+    container_format: str
+
+# Function to probe a media file, running ffprobe only once per file
+@functools.lru_cache(maxsize=8)
+def _probe(mkv_file: str) -> dict:
+    cmd = ['ffprobe', '-v', 'error', '-show_format', '-show_streams', '-of', 'json', mkv_file]
+    result = subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL, capture_output=True)
+    return json_loads(result.stdout)
+
+# Function to run an ffmpeg command, raising CalledProcessError if it fails
+def run_ffmpeg(args: list) -> None:
+    subprocess.run(FFMPEG_ARGS + args, check=True, stdin=subprocess.DEVNULL)
+
+# Function to probe the original MKV file and detect its duration, audio codec and container format
+def get_media_info(mkv_file: str) -> MediaInfo:
+    probe = _probe(mkv_file)
     audio_streams = [stream for stream in probe['streams'] if stream['codec_type'] == 'audio']
     if audio_streams:
-        codec_name = audio_streams[0]['codec_name']
-        container_format = probe['format']['format_name'].split(',')[0]
-        logging.info(f"Detected audio codec: {codec_name}, container format: {container_format}")
-        return codec_name, container_format
+        media_info = MediaInfo(
+            duration=float(probe['format']['duration']),
+            codec_name=audio_streams[0]['codec_name'],
+            container_format=probe['format']['format_name'].split(',')[0]
+        )
+        logging.info(f"Detected audio codec: {media_info.codec_name}, container format: {media_info.container_format}")
+        return media_info
     else:
         raise ValueError(f"No audio stream found in {mkv_file}")
 
-# Function to extract audio chunks (used only for silence detection)
-def extract_audio_chunks(mkv_file: str, output_dir: str, chunk_duration: int = 2700) -> list:
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    # Get video info (to extract duration)
-    probe = ffmpeg.probe(mkv_file)
-    duration = float(probe['format']['duration'])
-
-    # Number of chunks needed
-    num_chunks = math.ceil(duration / chunk_duration)
-
-    chunk_files = []
-
-    # Split the mkv file into chunks of given duration (for silence detection)
-    for i in range(num_chunks):
-        start_time = i * chunk_duration
-        output_chunk = os.path.join(output_dir, f"chunk_{i + 1}.wav")
-
-        # Check if the chunk file already exists
-        if os.path.exists(output_chunk):
-            logging.info(f"Chunk {output_chunk} already exists, skipping conversion.")
-        else:
-            logging.info(f"Creating chunk {output_chunk} from {start_time} seconds.")
-            # Use ffmpeg-python to split and convert to wav, ignoring video stream
-            (
-                ffmpeg
-                .input(mkv_file, ss=start_time, t=chunk_duration)
-                .output(output_chunk, format='wav', acodec='pcm_s16le', vn=None)  # Force no video stream
-                .run(overwrite_output=True)
-            )
-
-        chunk_files.append(output_chunk)
-
-    return chunk_files
-
-# Function to detect silences in the given wav file
-def detect_silence(wav_file: str, silence_threshold: int = -40, silence_duration: float = 2) -> list:
-    # Run ffmpeg's silencedetect filter to detect silences
-    output = (
-        ffmpeg
-        .input(wav_file)
-        .filter('silencedetect', noise=f'{silence_threshold}dB', d=silence_duration)
-        .output('null', f='null')
-        .run(capture_stderr=True, capture_stdout=True)
+# Function to detect silences in the MKV file's audio stream in a single pass
+async def detect_silence(mkv_file: str, silence_threshold: int = -40, silence_duration: float = 2) -> list:
+    # Run ffmpeg's silencedetect filter directly on the MKV's first audio stream (the one that gets split),
+    # no intermediate WAV needed
+    cmd = [
+        'ffmpeg', '-hide_banner', '-nostats', '-loglevel', 'info', '-i', mkv_file,
+        '-map', '0:a:0', '-af', f'silencedetect=noise={silence_threshold}dB:d={silence_duration}',
+        '-f', 'null', '-'
+    ]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
     )
 
-    stderr_output = output[1].decode('utf-8')
     silences = []
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)  # Kept only to report why ffmpeg failed
+
+    # Parse ffmpeg output line by line as it arrives to find silence start and end times
+    async for line in proc.stderr:
+        stderr_tail.append(line)
+        for kind, value in SILENCE_RE.findall(line):
+            if kind == b'start':
+                start = float(value)
+            else:
+                silences.append((start, float(value)))
 
-    # Parse ffmpeg output to find silence start and end times
-    for line in stderr_output.splitlines():
-        if "silence_start" in line:
-            start = float(line.split('silence_start: ')[1])
-        if "silence_end" in line:
-            end = float(line.split('silence_end: ')[1].split(' |')[0])
-            silences.append((start, end))
+    if await proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=b''.join(stderr_tail))
 
     return silences
 
-# Helper function to sort chunk files by their chunk number
-def sort_chunks(chunk_files: list) -> list:
-    # Sort based on the number in the chunk filename (e.g., chunk_1.wav -> 1)
-    def extract_chunk_number(filename: str) -> int:
-        match = re.search(r'chunk_(\d+)', filename)
-        return int(match.group(1)) if match else float('inf')
-
-    return sorted(chunk_files, key=extract_chunk_number)
-
-# Function to extract a frame from the middle of a split and save it as a cover image
-def extract_middle_frame(mkv_file: str, start_time: float, end_time: float, output_image: str) -> None:
-    middle_time = (start_time + end_time) / 2
-    logging.info(f"Extracting frame at {middle_time} seconds as cover image.")
-    (
-        ffmpeg
-        .input(mkv_file, ss=middle_time)
-        .output(output_image, vframes=1)
-        .run(overwrite_output=True)
+# Function to detect silences by thresholding the RMS level of 32 ms frames with NumPy, without silencedetect
+def detect_silence_rms(mkv_file: str, silence_threshold: int = -40, silence_duration: float = 2) -> list:
+    # Decode the audio stream once to raw mono PCM and read it from ffmpeg's stdout
+    cmd = FFMPEG_ARGS + ['-i', mkv_file, '-map', '0:a:0', '-f', 's16le', '-ac', '1', '-ar', str(RMS_SAMPLE_RATE), '-']
+    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+
+    threshold = 10 ** (silence_threshold / 20) * 32767  # Threshold in dBFS converted to a 16-bit amplitude
+    frame_bytes = RMS_FRAME_SIZE * 2
+    silent_frames = []
+
+    # Read in blocks of whole frames so memory stays bounded by one block plus one flag per frame
+    while True:
+        data = process.stdout.read(frame_bytes * RMS_FRAMES_PER_READ)
+        if not data:
+            break
+
+        num_frames = len(data) // frame_bytes  # A trailing partial frame at the end of the stream is dropped
+        frames = np.frombuffer(data, dtype=np.int16, count=num_frames * RMS_FRAME_SIZE).astype(np.float32)
+        frames = frames.reshape(num_frames, RMS_FRAME_SIZE)
+        rms = np.sqrt((frames ** 2).mean(axis=1))
+        silent_frames.append(rms < threshold)
+
+    process.stdout.close()
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+    if not silent_frames:
+        return []
+
+    # Find runs of silent frames: +1 marks where a run starts, -1 where it ends
+    silent = np.concatenate(silent_frames).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], silent, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # Keep only runs lasting at least the minimum silence duration
+    frame_duration = RMS_FRAME_SIZE / RMS_SAMPLE_RATE
+    keep = (ends - starts) * frame_duration >= silence_duration
+
+    return list(zip((starts[keep] * frame_duration).tolist(), (ends[keep] * frame_duration).tolist()))
+
+# Function to build the silence cache key from the MKV file's identity and the detection settings
+def silence_cache_key(mkv_file: str, silence_threshold: int, silence_duration: float, detector: str) -> str:
+    key = f"{os.path.getmtime(mkv_file)}|{os.path.getsize(mkv_file)}|{silence_threshold}|{silence_duration}|{detector}"
+    return hashlib.blake2b(key.encode()).hexdigest()[:16]
+
+# Function to extract a frame from the middle of each split and save them as cover images,
+# up to MAX_COVERS_PER_RUN covers per ffmpeg run
+def extract_middle_frames(mkv_file: str, covers: list, use_hwaccel: bool = False) -> None:
+    # Hardware decoding only helps here, where video frames are actually decoded
+    hwaccel_args = ['-hwaccel', 'auto'] if use_hwaccel else []
+
+    for batch_start in range(0, len(covers), MAX_COVERS_PER_RUN):
+        inputs = []
+        outputs = []
+        for index, (start_time, end_time, output_image) in enumerate(covers[batch_start:batch_start + MAX_COVERS_PER_RUN]):
+            middle_time = (start_time + end_time) / 2
+            logging.info(f"Extracting frame at {middle_time} seconds as cover image {output_image}.")
+            # Each cover gets its own input seeked to the middle of its split; without accurate seeking the cover is
+            # the keyframe at or before that point, so frames up to the exact time don't have to be decoded.
+            # A single decoder thread per input keeps threads and frame buffers bounded across many inputs
+            # and lets the first decoded frame come out without waiting on a frame-thread pipeline.
+            inputs += hwaccel_args + ['-threads', '1', '-ss', f'{middle_time:.6f}', '-noaccurate_seek', '-i', mkv_file]
+            outputs += ['-map', f'{index}:v:0', '-frames:v', '1', '-q:v', '3', output_image]
+
+        run_ffmpeg(inputs + outputs)
+
+# Function to merge silences separated by less than min_gap seconds of audio into one silence,
+# returning the merged silences and the index of the first original silence in each of them
+def merge_close_silences(silences: np.ndarray, min_gap: float) -> tuple:
+    if len(silences) == 0:
+        return silences, np.zeros(0, dtype=np.int64)
+
+    # A silence opens a new group unless it follows the previous one too closely; each group spans
+    # from the start of its first silence to the end of its last one
+    first = np.concatenate(([True], silences[1:, 0] - silences[:-1, 1] >= min_gap))
+    last = np.concatenate((first[1:], [True]))
+    return np.column_stack((silences[first, 0], silences[last, 1])), np.flatnonzero(first)
+
+# Function to cut the original MKV into parts in one ffmpeg run with the segment muxer, copying only the first
+# audio stream, and keep the parts with a split number as split audio files
+def split_audio_segments(mkv_file: str, output_dir: str, parts, split_numbers, container_format: str) -> None:
+    # '%' in the directory (e.g. from "100% talk.mkv") must not be read as part of ffmpeg's filename template
+    segment_pattern = os.path.join(output_dir.replace('%', '%%'), f"segment_%03d.{container_format}")
+    segment_args = ['-f', 'segment', '-segment_format', container_format, '-reset_timestamps', '1']
+    if len(parts) > 1:
+        # Fixed-point times: ffmpeg's time parser doesn't accept exponent notation such as 2.08333e-05
+        segment_args += ['-segment_times', ','.join(f'{end:.6f}' for end in parts[:-1, 1].tolist())]
+
+    logging.info(f"Splitting audio into {len(parts)} segments in a single pass.")
+    run_ffmpeg(
+        ['-i', mkv_file, '-map', '0:a:0', '-c', 'copy', '-avoid_negative_ts', 'make_zero']
+        + segment_args + [segment_pattern]
     )
 
-# Function to split original MKV by silence timestamps loaded from JSON files, and store only audio
-def split_original_by_silence(mkv_file: str, output_dir: str, chunk_duration: int, silence_threshold: int) -> None:
+    # Keep the audio parts under their split names and drop silences and too-short parts
+    for index, split_number in enumerate(split_numbers.tolist()):
+        segment_file = os.path.join(output_dir, f"segment_{index:03d}.{container_format}")
+        if not os.path.exists(segment_file):
+            continue
+
+        output_audio = os.path.join(output_dir, f"split_{split_number}.{container_format}")
+        if not split_number or os.path.exists(output_audio):
+            os.remove(segment_file)
+        else:
+            logging.info(f"Created split audio {output_audio}")
+            os.replace(segment_file, output_audio)
+
+# Function to split original MKV by silence timestamps, and store only audio
+def split_original_by_silence(mkv_file: str, output_dir: str, silences, max_workers: int = 1,
+                              use_hwaccel: bool = False) -> None:
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    prev_end = 0  # Start from the beginning of the original file
-    split_count = 0
-    all_silences = []
-
-    # Load silence points from JSON files for each chunk and sort them by chunk number
-    chunk_files = [
-        f for f in os.listdir(output_dir)
-        if f.endswith(f'_silence_{silence_threshold}.json') and not f.startswith('.')
+    # Get original container format and duration (the audio stream itself is copied as-is)
+    media_info = get_media_info(mkv_file)
+    container_format = media_info.container_format
+
+    # Audio between silences that is too short to be a split is folded into the surrounding silence
+    silences = np.asarray(silences, dtype=np.float64).reshape(-1, 2)
+    num_silences = len(silences)
+    silences, first_silence = merge_close_silences(silences, MIN_SPLIT_DURATION)
+    if len(silences) < num_silences:
+        logging.info(f"Merged {num_silences} silences into {len(silences)} split points.")
+
+    # Lay the file out as alternating audio and silence parts as (start, end) rows;
+    # row 2i is the audio before silence i and the last row is the audio after the last silence
+    parts = np.empty((2 * len(silences) + 1, 2))
+    parts[0::2, 0] = np.concatenate(([0.0], silences[:, 1]))
+    parts[0::2, 1] = np.concatenate((silences[:, 0], [media_info.duration]))
+    parts[1::2] = silences
+
+    # Number the audio parts as splits, where split N is the audio before original silence N (so numbers skip
+    # too-short parts); silences get 0 and are discarded after segmenting. After merging only the audio before
+    # the first silence can still be too short, while the part after the last silence is always kept.
+    keep = parts[0::2, 1] - parts[0::2, 0] >= MIN_SPLIT_DURATION
+    keep[-1] = True
+    split_numbers = np.zeros(len(parts), dtype=np.int64)
+    split_numbers[0::2] = np.where(keep, np.concatenate((first_silence, [num_silences])) + 1, 0)
+
+    num_skipped = num_silences - len(silences) + np.count_nonzero(~keep)
+    if num_skipped:
+        logging.info(f"Skipping {num_skipped} audio segments that are too short.")
+
+    # Empty parts (e.g. a silence at the very start) produce no segment
+    nonempty = parts[:, 1] > parts[:, 0]
+    parts, split_numbers = parts[nonempty], split_numbers[nonempty]
+
+    splits = [
+        (start, end, os.path.join(output_dir, f"split_{split_number}"))
+        for (start, end), split_number in zip(parts.tolist(), split_numbers.tolist()) if split_number
     ]
 
-    # Sort chunk files by chunk number
-    chunk_files = sort_chunks(chunk_files)
-
-    # Get original audio codec
-    audio_codec, container_format = get_audio_codec(mkv_file)
-
-    for chunk_file in chunk_files:
-        silence_json_path = os.path.join(output_dir, chunk_file)
-
-        # Load the silence points from the JSON file
-        logging.info(f"Loading silence data from {silence_json_path}")
-        with open(silence_json_path, 'r') as f:
-            silences = json.load(f)
-
-        # Adjust silences to original file's time
-        chunk_idx = int(chunk_file.split('_')[1]) - 1  # Extract chunk number from filename
-        chunk_offset = chunk_idx * chunk_duration
-        adjusted_silences = [(start + chunk_offset, end + chunk_offset) for start, end in silences]
-        all_silences.extend(adjusted_silences)
-
-    # Split the original file by detected silences, extracting only the audio stream
-    for silence in all_silences:
-        silence_start, silence_end = silence
-        if silence_start - prev_end < 10:  # Consider defining a constant for '10'
-            logging.info("Audio segment is too short, skipping.")
-            split_count += 1
-            prev_end = silence_end
-            continue
-
-        # Store the split audio stream in the original audio format
-        output_audio = os.path.join(output_dir, f"split_{split_count + 1}.{container_format}")
-        output_image = os.path.join(output_dir, f"split_{split_count + 1}.jpg")
-
-        if os.path.exists(output_audio):
-            logging.info(f"Split audio {output_audio} already exists, skipping.")
-        else:
-            logging.info(f"Creating split audio {output_audio} from {prev_end} to {silence_start} seconds.")
-            (
-                ffmpeg
-                .input(mkv_file, ss=prev_end, to=silence_start)
-                .output(output_audio, acodec=audio_codec, format=container_format, vn=None)  # Force no video stream
-                .run(overwrite_output=True)
-            )
-
-        # Extract a frame at the middle of the split as a cover image
+    # Collect the splits still missing a cover image (a frame from the middle of the split)
+    covers = []
+    for start, end, split_base in splits:
+        output_image = f"{split_base}.jpg"
         if os.path.exists(output_image):
             logging.info(f"Cover image {output_image} already exists, skipping.")
         else:
-            extract_middle_frame(mkv_file, prev_end, silence_start, output_image)
+            covers.append((start, end, output_image))
 
-        split_count += 1
-        prev_end = silence_end
+    # The audio split and the cover batches are independent ffmpeg runs, so run them side by side
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        if all(os.path.exists(f"{split_base}.{container_format}") for _, _, split_base in splits):
+            logging.info("All split audio files already exist, skipping.")
+        else:
+            futures.append(executor.submit(split_audio_segments, mkv_file, output_dir, parts, split_numbers, container_format))
 
-    # Split the remaining part of the original file after the last silence, and extract only audio
-    final_audio = os.path.join(output_dir, f"split_{split_count + 1}.{container_format}")
-    final_image = os.path.join(output_dir, f"split_{split_count + 1}.jpg")
+        # Leave one worker to the segment run, if queued, so no cover batch waits behind it
+        num_batches = max(1, max_workers - len(futures))
+        for batch in (covers[i::num_batches] for i in range(num_batches)):
+            if batch:
+                futures.append(executor.submit(extract_middle_frames, mkv_file, batch, use_hwaccel))
 
-    if os.path.exists(final_audio):
-        logging.info(f"Final split audio {final_audio} already exists, skipping.")
-    else:
-        logging.info(f"Creating final split audio {final_audio} from {prev_end} to the end.")
-        (
-            ffmpeg
-            .input(mkv_file, ss=prev_end)
-            .output(final_audio, acodec=audio_codec, format=container_format, vn=None)  # Force no video stream
-            .run(overwrite_output=True)
-        )
+        # Re-raise the first ffmpeg failure, if any
+        for future in futures:
+            future.result()
 
-    # Extract a frame at the middle of the final split
-    if os.path.exists(final_image):
-        logging.info(f"Final cover image {final_image} already exists, skipping.")
-    else:
-        extract_middle_frame(mkv_file, prev_end, float(ffmpeg.probe(mkv_file)['format']['duration']), final_image)
+# Function to parse a command-line value that must be a positive integer
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 # Main function to process the entire file
-def process_mkv_file(mkv_file: str, chunk_duration: int = 2700, silence_threshold: int = -40, silence_duration: float = 2) -> None:
+def process_mkv_file(mkv_file: str, silence_threshold: int = -40, silence_duration: float = 2,
+                     detector: str = 'silencedetect', max_workers: int = 1, use_hwaccel: bool = False) -> None:
     # Get the base name of the input MKV file for naming the output directory
     base_name = os.path.splitext(os.path.basename(mkv_file))[0]
 
@@ -209,31 +316,33 @@ def process_mkv_file(mkv_file: str, chunk_duration: int = 2700, silence_threshol
 
     logging.info(f"Creating output directory: {output_dir}")
 
-    # Step 1: Extract audio chunks (for silence detection)
-    logging.info("Extracting and splitting audio into chunks for silence detection...")
-    chunk_files = extract_audio_chunks(mkv_file, output_dir, chunk_duration)
-
-    # Step 2: Detect silence in each chunk
-    for chunk_file in chunk_files:
-        logging.info(f"Detecting silence in chunk: {chunk_file}")
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
 
-        # Define cache file for this chunk's silence data (with silence threshold included)
-        silence_cache_file = os.path.splitext(chunk_file)[0] + f"_silence_{silence_threshold}.json"
+    # Step 1: Detect silence over the whole original file, reusing cached results for unchanged inputs
+    cache_key = silence_cache_key(mkv_file, silence_threshold, silence_duration, detector)
+    silence_cache_file = os.path.join(output_dir, f"silences_{cache_key}.json")
 
-        # Check if silence data already exists for this chunk
-        if os.path.exists(silence_cache_file):
-            logging.info(f"Using cached silence data for {chunk_file}")
+    if os.path.exists(silence_cache_file):
+        logging.info(f"Using cached silence data from {silence_cache_file}")
+        with open(silence_cache_file, 'rb') as f:
+            silences = json_loads(f.read())
+    else:
+        logging.info(f"Detecting silence in the original file with the {detector} detector...")
+        if detector == 'rms':
+            silences = detect_silence_rms(mkv_file, silence_threshold, silence_duration)
         else:
-            # Detect silences in the current chunk
-            silences = detect_silence(chunk_file, silence_threshold, silence_duration)
+            silences = asyncio.run(detect_silence(mkv_file, silence_threshold, silence_duration))
 
-            # Save detected silences to cache (with silence threshold in the filename)
-            with open(silence_cache_file, 'w') as f:
-                json.dump(silences, f, indent=4)
+        # Save detected silences to cache (the key changes whenever the file or the settings do); write to a
+        # temporary file first so an interrupted write never leaves a truncated cache under the final name
+        with open(silence_cache_file + '.tmp', 'wb') as f:
+            f.write(json_dumps(silences))
+        os.replace(silence_cache_file + '.tmp', silence_cache_file)
 
-    # Step 3: Split the original MKV by the adjusted silence timestamps, and save only audio
+    # Step 2: Split the original MKV by the detected silence timestamps, and save only audio
     logging.info("Splitting the original file by detected silences and saving audio streams...")
-    split_original_by_silence(mkv_file, output_dir, chunk_duration, silence_threshold)
+    split_original_by_silence(mkv_file, output_dir, silences, max_workers, use_hwaccel)
 
     logging.info("Processing completed!")
 
@@ -242,19 +351,32 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Extract audio from MKV, split by silence, and save the result.")
 
     parser.add_argument('--mkv_file', type=str, required=True, help='Path to the MKV file.')
-    parser.add_argument('--chunk_duration', type=int, default=45 * 60,
-                        help='Chunk duration in seconds (default is 45 minutes).')
     parser.add_argument('--silence_threshold', type=int, default=-40,
                         help='Silence threshold in dB (default is -40dB).')
     parser.add_argument('--silence_duration', type=float, default=2,
                         help='Minimum silence duration in seconds (default is 2 seconds).')
+    parser.add_argument('--detector', type=str, choices=['silencedetect', 'rms'], default='silencedetect',
+                        help="Silence detector: ffmpeg's silencedetect filter or a NumPy RMS scan "
+                             "of 32 ms frames (default is silencedetect).")
+    parser.add_argument('--max_workers', type=positive_int, default=os.cpu_count() or 1,
+                        help='Maximum number of ffmpeg processes run at once when splitting and extracting '
+                             'cover images (default is the number of CPU cores).')
+    parser.add_argument('--use_hwaccel', action='store_true',
+                        help='Use hardware-accelerated video decoding when extracting cover images.')
+    # Deprecated: silence detection no longer works in chunks; still accepted so existing invocations keep working
+    parser.add_argument('--chunk_duration', type=int, help=argparse.SUPPRESS)
 
     args = parser.parse_args()
 
+    if args.chunk_duration is not None:
+        logging.warning("--chunk_duration is deprecated and ignored: silence is detected in a single pass over the whole file.")
+
     # Call the processing function with the provided arguments
     process_mkv_file(
         args.mkv_file,
-        chunk_duration=args.chunk_duration,
         silence_threshold=args.silence_threshold,
-        silence_duration=args.silence_duration
+        silence_duration=args.silence_duration,
+        detector=args.detector,
+        max_workers=args.max_workers,
+        use_hwaccel=args.use_hwaccel
     )
\ No newline at end of file
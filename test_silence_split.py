@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+import pytest
+
+import silence_split
+from silence_split import MediaInfo, SILENCE_RE, merge_close_silences, split_original_by_silence
+
+
+# Stub ffmpeg: the segment run writes one empty file per segment, cover runs do nothing
+@pytest.fixture
+def ffmpeg_runs(monkeypatch):
+    runs = []
+
+    def fake_run_ffmpeg(args: list) -> None:
+        runs.append(args)
+        if 'segment' in args:
+            times = args[args.index('-segment_times') + 1].split(',') if '-segment_times' in args else []
+            pattern = args[-1].replace('%%', '%')
+            for index in range(len(times) + 1):
+                open(pattern % index, 'wb').close()
+
+    monkeypatch.setattr(silence_split, 'run_ffmpeg', fake_run_ffmpeg)
+    return runs
+
+
+def split_files(output_dir) -> list:
+    return sorted(name for name in os.listdir(output_dir) if not name.endswith('.jpg'))
+
+
+def run_split(monkeypatch, tmp_path, silences: list, duration: float) -> list:
+    monkeypatch.setattr(silence_split, 'get_media_info', lambda mkv_file: MediaInfo(duration, 'aac', 'matroska'))
+    split_original_by_silence('input.mkv', str(tmp_path), silences)
+    return split_files(tmp_path)
+
+
+def test_merge_close_silences_empty():
+    merged, first = merge_close_silences(np.empty((0, 2)), 10)
+    assert merged.shape == (0, 2)
+    assert first.tolist() == []
+
+
+def test_merge_close_silences_single():
+    merged, first = merge_close_silences(np.array([[5.0, 8.0]]), 10)
+    assert merged.tolist() == [[5.0, 8.0]]
+    assert first.tolist() == [0]
+
+
+def test_merge_close_silences_chained():
+    silences = np.array([[0.0, 3.0], [5.0, 8.0], [12.0, 14.0], [30.0, 33.0], [35.0, 40.0]])
+    merged, first = merge_close_silences(silences, 10)
+    assert merged.tolist() == [[0.0, 14.0], [30.0, 40.0]]
+    assert first.tolist() == [0, 3]
+
+
+def test_split_numbers_skip_leading_short_part(monkeypatch, tmp_path, ffmpeg_runs):
+    # split_N is the audio before silence N; the 5 s before the first silence is too short
+    files = run_split(monkeypatch, tmp_path, [(5.0, 8.0), (30.0, 33.0)], 50.0)
+    assert files == ['split_2.matroska', 'split_3.matroska']
+
+
+def test_split_numbers_silence_at_start_and_merged_short_parts(monkeypatch, tmp_path, ffmpeg_runs):
+    files = run_split(monkeypatch, tmp_path, [(0.0, 2.0), (30.0, 33.0), (35.0, 40.0), (70.0, 72.0)], 100.0)
+    assert files == ['split_2.matroska', 'split_4.matroska', 'split_5.matroska']
+
+
+def test_split_numbers_final_part_only(monkeypatch, tmp_path, ffmpeg_runs):
+    files = run_split(monkeypatch, tmp_path, [], 100.0)
+    assert files == ['split_1.matroska']
+
+
+def test_segment_times_are_fixed_point(monkeypatch, tmp_path, ffmpeg_runs):
+    run_split(monkeypatch, tmp_path, [(2.08333e-05, 3.0), (30.0, 33.0)], 100.0)
+    segment_run = next(args for args in ffmpeg_runs if 'segment' in args)
+    times = segment_run[segment_run.index('-segment_times') + 1]
+    assert 'e' not in times
+
+
+def test_silence_re_negative_and_exponent_values():
+    stderr = (
+        b'[silencedetect @ 0x1] silence_start: -0.0213\n'
+        b'[silencedetect @ 0x1] silence_end: 6.25e-05 | silence_duration: 2.5\n'
+        b'[silencedetect @ 0x1] silence_start: 1.5e+01\n'
+    )
+    matches = [(kind, float(value)) for kind, value in SILENCE_RE.findall(stderr)]
+    assert matches == [(b'start', -0.0213), (b'end', 6.25e-05), (b'start', 15.0)]